@@ -2,14 +2,16 @@ from mcp.server.fastmcp import FastMCP
 from src.naver import search_naver_blog, search_naver_cafe_article, search_naver_image, search_kin, search_naver_local, search_news, search_shopping
 from src.kakao import search_daum_blog, search_daum_cafe, search_kakao_local, search_car_directions
 from src.sk import search_transit_route, search_transit_route_detail
-from src.web import get_webpage_content
-from src.config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, KAKAO_REST_API_KEY, SK_APP_KEY
+from src.web import get_webpage_content, get_prefetch_stats
+from src.config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, KAKAO_REST_API_KEY, SK_APP_KEY, WEB_PREFETCH_ENABLED
 
 # Create an MCP server
 mcp = FastMCP("KiMCP", dependencies=["httpx", "beautifulsoup4"])
 
 # Register web utility tools
 mcp.add_tool(get_webpage_content)
+if WEB_PREFETCH_ENABLED:
+    mcp.add_tool(get_prefetch_stats)
 
 # Register all Naver API tools only if credentials are set
 if NAVER_CLIENT_ID and NAVER_CLIENT_SECRET:
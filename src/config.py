@@ -9,3 +9,11 @@ KAKAO_REST_API_KEY = os.environ.get("KAKAO_REST_API_KEY")
 
 # SK Open API credentials
 SK_APP_KEY = os.environ.get("SK_APP_KEY")
+
+# Speculative prefetch of top search result pages (opt-in)
+WEB_PREFETCH_ENABLED = os.environ.get("WEB_PREFETCH_ENABLED", "").lower() in ("1", "true", "yes")
+WEB_PREFETCH_TOP_K = max(0, int(os.environ.get("WEB_PREFETCH_TOP_K", "3")))
+WEB_PREFETCH_CONCURRENCY = max(1, int(os.environ.get("WEB_PREFETCH_CONCURRENCY", "2")))
+WEB_PREFETCH_PER_HOST = max(1, int(os.environ.get("WEB_PREFETCH_PER_HOST", "1")))
+WEB_PREFETCH_CACHE_SIZE = max(1, int(os.environ.get("WEB_PREFETCH_CACHE_SIZE", "32")))
+WEB_PREFETCH_TTL = float(os.environ.get("WEB_PREFETCH_TTL", "300"))
@@ -1,5 +1,6 @@
 import httpx
 from .config import KAKAO_REST_API_KEY
+from .web import prefetch_links
 
 # API endpoints
 API_ENDPOINT = "https://dapi.kakao.com/v2"
@@ -41,7 +42,10 @@ async def search_daum_blog(
             },
         )
 
-    return response.json()
+    result = response.json()
+    prefetch_links(doc.get("url") for doc in result.get("documents", []))
+
+    return result
 
 
 async def search_daum_cafe(
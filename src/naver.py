@@ -1,5 +1,6 @@
 import httpx
-from .config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from .config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, WEB_PREFETCH_ENABLED
+from .web import prefetch_links
 
 # API endpoints
 API_ENDPOINT = "https://openapi.naver.com/v1"
@@ -41,6 +42,11 @@ async def search_naver_blog(
         )
 
         response.raise_for_status()
+
+        # Only parse the results again when they are going to be prefetched
+        if WEB_PREFETCH_ENABLED:
+            prefetch_links(item.get("link") for item in response.json().get("items", []))
+
         return response.text
 
 # https://developers.naver.com/docs/serviceapi/search/news/news.md
@@ -75,6 +81,11 @@ async def search_news(
         )
 
         response.raise_for_status()
+
+        # Only parse the results again when they are going to be prefetched
+        if WEB_PREFETCH_ENABLED:
+            prefetch_links(item.get("link") for item in response.json().get("items", []))
+
         return response.text
 
 # https://developers.naver.com/docs/serviceapi/search/cafearticle/cafearticle.md
@@ -1,5 +1,188 @@
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
 import httpx
 from bs4 import BeautifulSoup
+from .config import (
+    WEB_PREFETCH_ENABLED,
+    WEB_PREFETCH_TOP_K,
+    WEB_PREFETCH_CONCURRENCY,
+    WEB_PREFETCH_PER_HOST,
+    WEB_PREFETCH_CACHE_SIZE,
+    WEB_PREFETCH_TTL,
+)
+
+# Prefetched page contents in LRU order: link -> (expires_at, text)
+_prefetch_cache = OrderedDict()
+
+# Scheduled prefetch tasks by link, and the subset that has started fetching
+_prefetch_pending = {}
+_prefetch_fetching = set()
+
+_prefetch_slots = asyncio.Semaphore(WEB_PREFETCH_CONCURRENCY)
+
+# Per-host semaphores and the number of prefetches holding or waiting on each
+_prefetch_host_slots = {}
+_prefetch_host_users = {}
+
+# Prefetches only touch the network while no foreground request is running
+_foreground_requests = 0
+_foreground_idle = asyncio.Event()
+_foreground_idle.set()
+
+_prefetch_stats = {
+    "scheduled": 0,
+    "completed": 0,
+    "failed": 0,
+    "cancelled": 0,
+    "used": 0,
+    "wasted": 0,
+}
+
+
+def _normalize_link(link: str) -> str:
+    # Convert Naver blog links to mobile version for better parsing
+    if "https://blog.naver.com" in link:
+        link = link.replace("blog.naver.com", "m.blog.naver.com")
+    return link
+
+
+async def _fetch_html(link: str) -> str:
+    async with httpx.AsyncClient(follow_redirects=True) as client:
+        response = await client.get(link)
+        response.raise_for_status()
+        return response.text
+
+
+def _extract_text(html: str) -> str:
+    # Parse the response to get the text content only
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Remove script and style elements
+    for script_or_style in soup(["script", "style"]):
+        script_or_style.decompose()
+
+    # Get text content
+    text = soup.get_text()
+
+    # Clean up text: remove multiple newlines and whitespace
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip()
+              for line in lines for phrase in line.split("  "))
+    text = '\n'.join(chunk for chunk in chunks if chunk)
+
+    return text
+
+
+def _drop_expired():
+    # Entries are stored in expiry order, since every entry shares the same TTL
+    now = time.monotonic()
+    while _prefetch_cache:
+        link, (expires_at, _) = next(iter(_prefetch_cache.items()))
+        if expires_at > now:
+            break
+        del _prefetch_cache[link]
+        _prefetch_stats["wasted"] += 1
+
+
+def _take_prefetched(link: str):
+    _drop_expired()
+
+    entry = _prefetch_cache.pop(link, None)
+    if entry is None:
+        return None
+
+    _prefetch_stats["used"] += 1
+    return entry[1]
+
+
+def _store_prefetched(link: str, text: str):
+    _drop_expired()
+
+    _prefetch_cache[link] = (time.monotonic() + WEB_PREFETCH_TTL, text)
+    _prefetch_cache.move_to_end(link)
+
+    # Evict least recently prefetched pages that were never read
+    while _prefetch_cache and len(_prefetch_cache) > WEB_PREFETCH_CACHE_SIZE:
+        _prefetch_cache.popitem(last=False)
+        _prefetch_stats["wasted"] += 1
+
+
+async def _prefetch(link: str):
+    host = urlparse(link).netloc
+    if host not in _prefetch_host_slots:
+        _prefetch_host_slots[host] = asyncio.Semaphore(WEB_PREFETCH_PER_HOST)
+        _prefetch_host_users[host] = 0
+    host_slots = _prefetch_host_slots[host]
+    _prefetch_host_users[host] += 1
+
+    try:
+        while True:
+            await _foreground_idle.wait()
+
+            # Take the host slot first so a busy host does not hold a global slot
+            async with host_slots, _prefetch_slots:
+                # A foreground request may have started while waiting for the slots
+                if not _foreground_idle.is_set():
+                    continue
+
+                _prefetch_fetching.add(link)
+                try:
+                    html = await _fetch_html(link)
+                    # Parse off the event loop so foreground requests are not blocked
+                    text = await asyncio.to_thread(_extract_text, html)
+                except Exception:
+                    _prefetch_stats["failed"] += 1
+                    return None
+                finally:
+                    _prefetch_fetching.discard(link)
+
+                _store_prefetched(link, text)
+                _prefetch_stats["completed"] += 1
+                return text
+    finally:
+        _prefetch_host_users[host] -= 1
+        if _prefetch_host_users[host] == 0:
+            del _prefetch_host_users[host]
+            del _prefetch_host_slots[host]
+
+
+def _on_prefetch_done(link: str, task: asyncio.Task):
+    if _prefetch_pending.get(link) is task:
+        del _prefetch_pending[link]
+    if task.cancelled():
+        _prefetch_stats["cancelled"] += 1
+
+
+def prefetch_links(links):
+    """
+    Schedule background fetching of the top search result links.
+    Fetched contents are kept in a bounded cache that get_webpage_content checks first.
+    Does nothing unless WEB_PREFETCH_ENABLED is set.
+
+    Args:
+        links (Iterable[str]): Result links in ranking order.
+    """
+    if not WEB_PREFETCH_ENABLED:
+        return
+
+    _drop_expired()
+
+    for link in itertools.islice(links, WEB_PREFETCH_TOP_K):
+        if not link:
+            continue
+
+        link = _normalize_link(link)
+        if link in _prefetch_cache or link in _prefetch_pending:
+            continue
+
+        task = asyncio.create_task(_prefetch(link))
+        task.add_done_callback(lambda t, link=link: _on_prefetch_done(link, t))
+        _prefetch_pending[link] = task
+        _prefetch_stats["scheduled"] += 1
 
 
 async def get_webpage_content(link: str) -> str:
@@ -13,28 +196,50 @@ async def get_webpage_content(link: str) -> str:
     Returns:
         str: The full content of the webpage with HTML tags removed.
     """
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        # Convert Naver blog links to mobile version for better parsing
-        if "https://blog.naver.com" in link:
-            link = link.replace("blog.naver.com", "m.blog.naver.com")
+    global _foreground_requests
 
-        response = await client.get(link)
-        response.raise_for_status()
+    link = _normalize_link(link)
 
-        # Parse the response to get the text content only
-        soup = BeautifulSoup(response.text, 'html.parser')
+    text = _take_prefetched(link)
+    if text is not None:
+        return text
 
-        # Remove script and style elements
-        for script_or_style in soup(["script", "style"]):
-            script_or_style.decompose()
+    _foreground_requests += 1
+    _foreground_idle.clear()
+    try:
+        task = _prefetch_pending.get(link)
+        if task is not None:
+            if link in _prefetch_fetching:
+                # Join the prefetch already on the wire instead of fetching twice
+                await asyncio.wait({task})
+                text = None if task.cancelled() else task.result()
+                if text is not None:
+                    # Other requests joining the same prefetch share the task result
+                    _take_prefetched(link)
+                    return text
+            else:
+                task.cancel()
 
-        # Get text content
-        text = soup.get_text()
+        return _extract_text(await _fetch_html(link))
+    finally:
+        _foreground_requests -= 1
+        if _foreground_requests == 0:
+            _foreground_idle.set()
 
-        # Clean up text: remove multiple newlines and whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip()
-                  for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
 
-        return text
+async def get_prefetch_stats() -> dict:
+    """
+    Get statistics of the background prefetch of search result pages.
+    "used" counts prefetched pages served by get_webpage_content, and "wasted" counts
+    prefetched pages evicted or expired before being read.
+
+    Returns:
+        dict: Prefetch counters along with the current cache and pending sizes.
+    """
+    _drop_expired()
+
+    return {
+        **_prefetch_stats,
+        "cached": len(_prefetch_cache),
+        "pending": len(_prefetch_pending),
+    }
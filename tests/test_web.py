@@ -0,0 +1,384 @@
+import asyncio
+import json
+
+import pytest
+
+from src import kakao, naver, web
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakeFetcher:
+    """Stands in for web._fetch_html; links listed in `blocked` wait for release()."""
+
+    def __init__(self, blocked=()):
+        self.blocked = set(blocked)
+        self.gates = {}
+        self.started = []
+        self.failing = set()
+
+    async def __call__(self, link):
+        self.started.append(link)
+        if link in self.blocked:
+            gate = self.gates.setdefault(link, asyncio.Event())
+            await gate.wait()
+        if link in self.failing:
+            raise RuntimeError(link)
+        return f"<p>text of {link}</p><script>ignored()</script>"
+
+    def release(self, link):
+        self.blocked.discard(link)
+        self.gates.setdefault(link, asyncio.Event()).set()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(web, "time", clock)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def prefetch_state(monkeypatch, clock):
+    monkeypatch.setattr(web, "WEB_PREFETCH_ENABLED", True)
+    monkeypatch.setattr(web, "WEB_PREFETCH_TOP_K", 3)
+    monkeypatch.setattr(web, "WEB_PREFETCH_PER_HOST", 1)
+    monkeypatch.setattr(web, "WEB_PREFETCH_CACHE_SIZE", 32)
+    monkeypatch.setattr(web, "WEB_PREFETCH_TTL", 300)
+    monkeypatch.setattr(web, "_prefetch_cache", web.OrderedDict())
+    monkeypatch.setattr(web, "_prefetch_pending", {})
+    monkeypatch.setattr(web, "_prefetch_fetching", set())
+    monkeypatch.setattr(web, "_prefetch_host_slots", {})
+    monkeypatch.setattr(web, "_prefetch_host_users", {})
+    monkeypatch.setattr(web, "_foreground_requests", 0)
+    monkeypatch.setattr(web, "_prefetch_slots", asyncio.Semaphore(2))
+    foreground_idle = asyncio.Event()
+    foreground_idle.set()
+    monkeypatch.setattr(web, "_foreground_idle", foreground_idle)
+    monkeypatch.setattr(web, "_prefetch_stats", dict.fromkeys(web._prefetch_stats, 0))
+
+
+def run(coro_fn):
+    return asyncio.run(coro_fn())
+
+
+async def settle():
+    # Prefetches hand parsing to a worker thread, so yielding once is not enough
+    for _ in range(20):
+        await asyncio.sleep(0.001)
+
+
+def test_prefetched_page_is_served_from_cache(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1", "http://a/2"])
+        await settle()
+        text = await web.get_webpage_content("http://a/1")
+        return text, await web.get_prefetch_stats()
+
+    text, stats = run(scenario)
+
+    assert text == "text of http://a/1"
+    assert fetcher.started == ["http://a/1", "http://a/2"]
+    assert stats["used"] == 1
+    assert stats["completed"] == 2
+    assert stats["cached"] == 1
+
+
+def test_only_top_k_links_are_prefetched(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    monkeypatch.setattr(web, "WEB_PREFETCH_TOP_K", 2)
+
+    async def scenario():
+        web.prefetch_links([None, "http://a/1", "http://b/2", "http://c/3"])
+        await settle()
+
+    run(scenario)
+
+    assert fetcher.started == ["http://a/1"]
+
+
+def test_disabled_prefetch_does_nothing(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    monkeypatch.setattr(web, "WEB_PREFETCH_ENABLED", False)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1"])
+        await settle()
+
+    run(scenario)
+
+    assert fetcher.started == []
+    assert web._prefetch_stats["scheduled"] == 0
+
+
+def test_lru_eviction_counts_wasted(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    monkeypatch.setattr(web, "WEB_PREFETCH_CACHE_SIZE", 2)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1", "http://b/2", "http://c/3"])
+        await settle()
+        return await web.get_prefetch_stats()
+
+    stats = run(scenario)
+
+    assert list(web._prefetch_cache) == ["http://b/2", "http://c/3"]
+    assert stats["wasted"] == 1
+    assert stats["cached"] == 2
+
+
+def test_expired_entries_are_wasted_and_prefetched_again(monkeypatch, clock):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1", "http://b/2"])
+        await settle()
+        clock.now += 301
+        expired = await web.get_prefetch_stats()
+
+        web.prefetch_links(["http://a/1"])
+        await settle()
+        text = await web.get_webpage_content("http://a/1")
+        return expired, text, await web.get_prefetch_stats()
+
+    expired, text, stats = run(scenario)
+
+    assert expired["wasted"] == 2
+    assert expired["cached"] == 0
+    assert text == "text of http://a/1"
+    assert fetcher.started == ["http://a/1", "http://b/2", "http://a/1"]
+    assert stats["used"] == 1
+    assert stats["wasted"] == 2
+
+
+def test_foreground_request_cancels_prefetch_not_started(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1"])
+        text = await web.get_webpage_content("http://a/1")
+        await settle()
+        return text, await web.get_prefetch_stats()
+
+    text, stats = run(scenario)
+
+    assert text == "text of http://a/1"
+    assert fetcher.started == ["http://a/1"]
+    assert stats["cancelled"] == 1
+    assert stats["pending"] == 0
+
+
+def test_concurrent_foreground_requests_share_prefetch_in_flight(monkeypatch):
+    fetcher = FakeFetcher(blocked=["http://a/1"])
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1"])
+        await settle()
+        requests = [
+            asyncio.create_task(web.get_webpage_content("http://a/1")),
+            asyncio.create_task(web.get_webpage_content("http://a/1")),
+        ]
+        await settle()
+        fetcher.release("http://a/1")
+        return await asyncio.gather(*requests), await web.get_prefetch_stats()
+
+    texts, stats = run(scenario)
+
+    assert texts == ["text of http://a/1", "text of http://a/1"]
+    assert fetcher.started == ["http://a/1"]
+    assert stats["used"] == 1
+    assert stats["cached"] == 0
+
+
+def test_foreground_request_joins_prefetch_in_flight(monkeypatch):
+    fetcher = FakeFetcher(blocked=["http://a/1"])
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1"])
+        await settle()
+        request = asyncio.create_task(web.get_webpage_content("http://a/1"))
+        await settle()
+        fetcher.release("http://a/1")
+        return await request, await web.get_prefetch_stats()
+
+    text, stats = run(scenario)
+
+    assert text == "text of http://a/1"
+    assert fetcher.started == ["http://a/1"]
+    assert stats["used"] == 1
+
+
+def test_prefetch_waits_for_foreground_requests(monkeypatch):
+    fetcher = FakeFetcher(blocked=["http://a/1"])
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        request = asyncio.create_task(web.get_webpage_content("http://a/1"))
+        await settle()
+        web.prefetch_links(["http://b/2"])
+        await settle()
+        started_while_busy = list(fetcher.started)
+        fetcher.release("http://a/1")
+        await request
+        await settle()
+        return started_while_busy
+
+    started_while_busy = run(scenario)
+
+    assert started_while_busy == ["http://a/1"]
+    assert fetcher.started == ["http://a/1", "http://b/2"]
+
+
+def test_busy_host_does_not_hold_global_slot(monkeypatch):
+    fetcher = FakeFetcher(blocked=["http://h1/a", "http://h1/b", "http://h2/c"])
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://h1/a", "http://h1/b", "http://h2/c"])
+        await settle()
+        started = list(fetcher.started)
+        for link in ["http://h1/a", "http://h1/b", "http://h2/c"]:
+            fetcher.release(link)
+        await settle()
+        return started
+
+    started = run(scenario)
+
+    assert started == ["http://h1/a", "http://h2/c"]
+    assert fetcher.started == ["http://h1/a", "http://h2/c", "http://h1/b"]
+    assert web._prefetch_host_slots == {}
+    assert web._prefetch_host_users == {}
+
+
+def test_failed_prefetch_is_counted(monkeypatch):
+    fetcher = FakeFetcher()
+    fetcher.failing.add("http://a/1")
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+
+    async def scenario():
+        web.prefetch_links(["http://a/1"])
+        await settle()
+        return await web.get_prefetch_stats()
+
+    stats = run(scenario)
+
+    assert stats["failed"] == 1
+    assert stats["cached"] == 0
+    assert stats["pending"] == 0
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+        self.text = json.dumps(payload)
+        self.json_calls = 0
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        self.json_calls += 1
+        return self.payload
+
+
+class FakeClient:
+    def __init__(self, response):
+        self.response = response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def get(self, url, **kwargs):
+        return self.response
+
+
+def stub_search_response(monkeypatch, payload):
+    response = FakeResponse(payload)
+    monkeypatch.setattr(web.httpx, "AsyncClient", lambda *args, **kwargs: FakeClient(response))
+    return response
+
+
+def test_naver_search_prefetches_result_links(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    monkeypatch.setattr(naver, "WEB_PREFETCH_ENABLED", True)
+    stub_search_response(monkeypatch, {"items": [
+        {"link": "https://blog.naver.com/user/1", "bloggerlink": "https://blog.naver.com/user"},
+        {"link": "https://example.com/post"},
+    ]})
+
+    async def scenario():
+        await naver.search_naver_blog("query")
+        await settle()
+
+    run(scenario)
+
+    assert fetcher.started == ["https://m.blog.naver.com/user/1", "https://example.com/post"]
+
+
+def test_naver_search_skips_prefetch_when_disabled(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    monkeypatch.setattr(naver, "WEB_PREFETCH_ENABLED", False)
+    monkeypatch.setattr(web, "WEB_PREFETCH_ENABLED", False)
+    response = stub_search_response(monkeypatch, {"items": [{"link": "https://example.com/news"}]})
+
+    async def scenario():
+        await naver.search_news("query")
+        await settle()
+
+    run(scenario)
+
+    assert fetcher.started == []
+    assert response.json_calls == 0
+
+
+def test_daum_search_prefetches_document_urls(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    stub_search_response(monkeypatch, {"documents": [
+        {"url": "https://a.tistory.com/1", "blogname": "a"},
+        {"url": "https://brunch.co.kr/@b/2", "blogname": "b"},
+    ]})
+
+    async def scenario():
+        await kakao.search_daum_blog("query")
+        await settle()
+
+    run(scenario)
+
+    assert fetcher.started == ["https://a.tistory.com/1", "https://brunch.co.kr/@b/2"]
+
+
+def test_daum_search_skips_prefetch_when_disabled(monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(web, "_fetch_html", fetcher)
+    monkeypatch.setattr(web, "WEB_PREFETCH_ENABLED", False)
+    stub_search_response(monkeypatch, {"documents": [{"url": "https://a.tistory.com/1"}]})
+
+    async def scenario():
+        return await kakao.search_daum_blog("query")
+
+    result = run(scenario)
+
+    assert result == {"documents": [{"url": "https://a.tistory.com/1"}]}
+    assert fetcher.started == []